@@ -11,9 +11,11 @@ import rospy
 
 from std_msgs.msg import String, Header
 from geometry_msgs.msg import TransformStamped
+from sensor_msgs.msg import Image, PointCloud2
 
 from morse.middleware.ros.tfMessage import tfMessage
 from morse.middleware import AbstractDatastream
+from morse.core.exceptions import MorseMiddlewareError
 
 from morse.core.blenderapi import persistantstorage
 
@@ -76,6 +78,9 @@ class AbstractROS(AbstractDatastream):
 class ROSPublisher(AbstractROS):
     """ Base class for all ROS Publishers """
     default_frame_id = 'USE_TOPIC_NAME'
+    # ROS messages too large to queue one second of them (images, clouds)
+    large_ros_classes = (Image, PointCloud2)
+    large_queue_size = 2
 
     def initialize(self):
         AbstractROS.initialize(self)
@@ -96,9 +101,23 @@ class ROSPublisher(AbstractROS):
     def determine_queue_size(self):
         """
         Determine a suitable queue_size for the ros publisher
+
+        Use the 'queue_size' kwarg if set, else one second of messages,
+        bounded by large_queue_size for large messages (large_ros_classes)
         :return: queue_size
         """
-        return max(1, self.component_instance.frequency)
+        if 'queue_size' in self.kwargs:
+            queue_size = self.kwargs['queue_size']
+            if isinstance(queue_size, bool) or \
+                    not isinstance(queue_size, int) or queue_size < 1:
+                raise MorseMiddlewareError("Invalid queue_size %r for %s: "
+                                           "expected a positive integer" %
+                                           (queue_size, self))
+            return queue_size
+        queue_size = max(1, self.component_instance.frequency)
+        if self.ros_class in self.large_ros_classes:
+            queue_size = min(queue_size, self.large_queue_size)
+        return queue_size
 
     def get_ros_header(self):
         header = Header()
@@ -122,15 +141,31 @@ class ROSPublisher(AbstractROS):
 class ROSPublisherTF(ROSPublisher):
     """ Base class for all ROS Publishers with TF support """
     topic_tf = None
+    topic_tf_users = 0
 
     def initialize(self):
         ROSPublisher.initialize(self)
         if not ROSPublisherTF.topic_tf:
-            ROSPublisherTF.topic_tf = rospy.Publisher("/tf", tfMessage, queue_size=self.determine_queue_size())
+            # /tf is shared by all components: do not apply this component
+            # specific queue_size settings to it
+            ROSPublisherTF.topic_tf = rospy.Publisher("/tf", tfMessage,
+                queue_size=max(1, self.component_instance.frequency))
+        self._topic_tf = ROSPublisherTF.topic_tf
+        ROSPublisherTF.topic_tf_users += 1
 
     def finalize(self):
         ROSPublisher.finalize(self)
-        ROSPublisherTF.topic_tf.unregister()
+        # The /tf publisher is shared by all instances: the last one using it
+        # unregisters it. finalize may run twice (del_functions, then
+        # __del__), or late for an instance of a previous run: only release
+        # the publisher this instance acquired, and only once.
+        topic_tf = getattr(self, '_topic_tf', None)
+        self._topic_tf = None
+        if topic_tf is not None and topic_tf is ROSPublisherTF.topic_tf:
+            ROSPublisherTF.topic_tf_users -= 1
+            if ROSPublisherTF.topic_tf_users == 0:
+                topic_tf.unregister()
+                ROSPublisherTF.topic_tf = None
 
     def get_robot_transform(self):
         """ Get the transformation relative to the robot origin
@@ -244,6 +279,6 @@ class StringReader(ROSSubscriber):
     ros_class = String
 
     def update(self, message):
-        logger.info("Received String message %s on topic %s" % \
-                    (message.data.decode("utf-8"), # String message decode
-                     self.topic_name))
+        logger.info("Received String message %s on topic %s",
+                    message.data.decode("utf-8"), # String message decode
+                    self.topic_name)
@@ -13,6 +13,6 @@ class WrenchReader(ROSSubscriber):
         self.data["torque"][0] = message.torque.x
         self.data["torque"][1] = message.torque.y
         self.data["torque"][2] = message.torque.z
-        logger.debug("Applying force: [%s, %s, %s], torque: [%s, %s, %s]"%
-                     (message.force.x, message.force.y, message.force.z,
-                      message.torque.x, message.torque.y, message.torque.z))
+        logger.debug("Applying force: [%s, %s, %s], torque: [%s, %s, %s]",
+                     message.force.x, message.force.y, message.force.z,
+                     message.torque.x, message.torque.y, message.torque.z)
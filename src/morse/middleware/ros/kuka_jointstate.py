@@ -7,9 +7,10 @@ class JointStateReader(ROSSubscriber):
     ros_class = JointState
 
     def update(self, message):
-        logger.debug("Received JointState names: %s on topic %s"%(message.name, self.topic_name))
-        logger.debug("Received JointState positons: %s on topic %s"%(message.position, self.topic_name))
-        logger.debug("Received JointState velocity: %s on topic %s"%(message.velocity, self.topic_name))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received JointState names: %s on topic %s", message.name, self.topic_name)
+            logger.debug("Received JointState positons: %s on topic %s", message.position, self.topic_name)
+            logger.debug("Received JointState velocity: %s on topic %s", message.velocity, self.topic_name)
 
         for i in range(7):
             self.data["kuka_%i"%(i+1)] = message.position[i]
@@ -10,5 +10,5 @@ class TwistReader(ROSSubscriber):
         self.data["x"] = message.linear.x
         self.data["y"] = message.linear.y
         self.data["w"] = message.angular.z # yaw
-        logger.debug("Executing x,y,omega movement: <%s, %s, %s>"%
-                     (message.linear.x, message.linear.y, message.angular.z))
+        logger.debug("Executing x,y,omega movement: <%s, %s, %s>",
+                     message.linear.x, message.linear.y, message.angular.z)
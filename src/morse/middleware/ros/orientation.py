@@ -13,5 +13,6 @@ class QuaternionReader(ROSSubscriber):
         self.data["roll"] = euler.x
         self.data["pitch"] = euler.y
         self.data["yaw"] = euler.z
-        logger.debug("Set orientation to RPY (%.3f %.3f %.3f)" % \
-                     tuple(math.degrees(a) for a in euler))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Set orientation to RPY (%.3f %.3f %.3f)",
+                         *(math.degrees(a) for a in euler))
@@ -35,6 +35,7 @@ class StaticTF2Publisher(StaticTFPublisher):
     """
     
     topic_tf_static = None
+    topic_tf_static_users = 0
     init_tr = False
 
     def initialize(self):
@@ -42,7 +43,20 @@ class StaticTF2Publisher(StaticTFPublisher):
         if not StaticTF2Publisher.topic_tf_static:
             StaticTF2Publisher.topic_tf_static = \
                 rospy.Publisher("/tf_static", tfMessage, queue_size=1, latch=True)
+        self._topic_tf_static = StaticTF2Publisher.topic_tf_static
+        StaticTF2Publisher.topic_tf_static_users += 1
 
+    def finalize(self):
+        StaticTFPublisher.finalize(self)
+        # same release scheme as the shared /tf publisher (ROSPublisherTF)
+        topic_tf_static = getattr(self, '_topic_tf_static', None)
+        self._topic_tf_static = None
+        if topic_tf_static is not None and \
+                topic_tf_static is StaticTF2Publisher.topic_tf_static:
+            StaticTF2Publisher.topic_tf_static_users -= 1
+            if StaticTF2Publisher.topic_tf_static_users == 0:
+                topic_tf_static.unregister()
+                StaticTF2Publisher.topic_tf_static = None
 
     def default(self, ci='unused'):
         if not self.init_tr and ('valid' not in self.data or self.data['valid']):
@@ -20,7 +20,8 @@ class CameraPublisher(ROSPublisherTF):
             ROSPublisherTF.initialize(self)
         else:
             ROSPublisher.initialize(self)
-        # Generate a publisher for the CameraInfo
+        # Generate a publisher for the CameraInfo, sized like the image
+        # topic (including a 'queue_size' kwarg) as both are paired
         self.topic_camera_info = rospy.Publisher(self.topic_name+'/camera_info', CameraInfo,
                                                  queue_size=self.determine_queue_size())
 
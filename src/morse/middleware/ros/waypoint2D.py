@@ -9,8 +9,8 @@ class Pose2DReader(ROSSubscriber):
     ros_class = Pose2D
 
     def update(self, message):
-        logger.debug("Received Pose2D: < %s, %s, %s > on topic %s"% \
-                (message.x, message.y, message.theta, self.topic_name ))
+        logger.debug("Received Pose2D: < %s, %s, %s > on topic %s",
+                     message.x, message.y, message.theta, self.topic_name)
         self.data["x"] = message.x
         self.data["y"] = message.y
         self.data["z"] = message.theta
@@ -0,0 +1,58 @@
+#! /usr/bin/env python
+"""
+This script tests the 'queue_size' option of the ROS publishers in MORSE.
+"""
+
+import sys
+import math
+from types import SimpleNamespace
+from morse.testing.ros import RosTestCase
+from morse.testing.testing import testlogger
+
+import rospy
+from geometry_msgs.msg import PoseStamped
+from sensor_msgs.msg import Image
+
+from morse.core.exceptions import MorseMiddlewareError
+from morse.middleware.ros.abstract_ros import ROSPublisher
+
+# Include this import to be able to use your test file as a regular
+# builder script, ie, usable with: 'morse [run|exec] base_testing.py
+try:
+    from morse.builder import *
+except ImportError:
+    pass
+
+def publisher(ros_class, frequency, **kwargs):
+    # bare ROSPublisher, without creating any topic
+    pub = ROSPublisher.__new__(ROSPublisher)
+    pub.topic = None # finalize, called from __del__, reads it
+    pub.ros_class = ros_class
+    pub.kwargs = kwargs
+    pub.component_instance = SimpleNamespace(frequency=frequency,
+                                    bge_object=SimpleNamespace(name='robot.pose'))
+    return pub
+
+class QueueSizeRosTest(RosTestCase):
+
+    def setUpEnv(self):
+        """ Defines the test scenario """
+
+        robot = ATRV()
+
+        env = Environment('empty', fastmode = True)
+
+    def test_determine_queue_size(self):
+        # one second of messages, bounded for large messages
+        self.assertEqual(publisher(PoseStamped, 20).determine_queue_size(), 20)
+        self.assertEqual(publisher(Image, 20).determine_queue_size(), 2)
+        self.assertEqual(publisher(Image, 20, queue_size=10).determine_queue_size(), 10)
+
+        for queue_size in ['ten', 2.5, 0, True]:
+            with self.assertRaises(MorseMiddlewareError):
+                publisher(PoseStamped, 20, queue_size=queue_size).determine_queue_size()
+
+########################## Run these tests ##########################
+if __name__ == "__main__":
+    from morse.testing.testing import main
+    main(QueueSizeRosTest, time_modes = [TimeStrategies.BestEffort])